@@ -0,0 +1,128 @@
+import time
+import config
+import utils
+
+# Change-driven sampling schedule.
+# For each sensor an EWMA and EWMA variance of the processed values is kept. While the
+# value stays close to its EWMA and the individual readings agree, the sensor is in
+# "steady" mode: it is sampled every ADAPTIVE_STEADY_PERIOD_S with fewer readings.
+# A jump beyond the change threshold, a noisy EWMA or a wide spread between readings
+# switches it to "event" mode (ADAPTIVE_EVENT_PERIOD_S, full reading count) for at least
+# ADAPTIVE_EVENT_HOLD_SAMPLES samples.
+
+STEADY = "steady"
+EVENT = "event"
+
+_states = {}
+
+def _get_state(sensor_key):
+    state = _states.get(sensor_key)
+    if state is None:
+        state = {
+            "ewma": None,
+            "variance": 0.0,
+            "mode": EVENT,
+            "hold": config.ADAPTIVE_EVENT_HOLD_SAMPLES,
+            "last_sample_ms": None,
+            "change_threshold": None,
+            "spread_threshold": None,
+        }
+        _states[sensor_key] = state
+    return state
+
+def set_thresholds(sensor_key, change_threshold, spread_threshold):
+    """Sets the thresholds that switch a sensor to event mode."""
+    state = _get_state(sensor_key)
+    state["change_threshold"] = change_threshold
+    state["spread_threshold"] = spread_threshold
+
+def get_num_readings(sensor_key, num_readings):
+    """Returns the number of readings to take now, given the configured full count."""
+    if not config.ADAPTIVE_SAMPLING_ENABLED:
+        return num_readings
+    if _get_state(sensor_key)["mode"] == STEADY:
+        return min(num_readings, config.ADAPTIVE_STEADY_NUM_READINGS)
+    return num_readings
+
+def get_period_s(sensor_key):
+    """Returns the current background sampling period of a sensor."""
+    if _get_state(sensor_key)["mode"] == STEADY:
+        return config.ADAPTIVE_STEADY_PERIOD_S
+    return config.ADAPTIVE_EVENT_PERIOD_S
+
+def is_due(sensor_key):
+    """Checks if the sensor should be sampled by the background scheduler."""
+    if not config.ADAPTIVE_SAMPLING_ENABLED:
+        return False
+    last_sample_ms = _get_state(sensor_key)["last_sample_ms"]
+    if last_sample_ms is None:
+        return True
+    return time.ticks_diff(time.ticks_ms(), last_sample_ms) >= get_period_s(sensor_key) * 1000
+
+def get_seconds_until_due(sensor_key):
+    """
+    Returns the number of seconds until the next background sample of a sensor,
+    or None if adaptive sampling is disabled.
+    """
+    if not config.ADAPTIVE_SAMPLING_ENABLED:
+        return None
+    last_sample_ms = _get_state(sensor_key)["last_sample_ms"]
+    if last_sample_ms is None:
+        return 0
+    elapsed_ms = time.ticks_diff(time.ticks_ms(), last_sample_ms)
+    return max(0, (get_period_s(sensor_key) * 1000 - elapsed_ms) // 1000)
+
+def observe(sensor_key, value, spread=0):
+    """
+    Updates the EWMA/variance of a sensor with a processed value and adjusts its mode.
+    spread is the mean distance between the central value and the individual readings.
+    A value of None records a failed acquisition without changing the statistics.
+    """
+    state = _get_state(sensor_key)
+    state["last_sample_ms"] = time.ticks_ms()
+    if value is None:
+        return
+
+    if state["ewma"] is None:
+        state["ewma"] = value
+        return
+
+    alpha = config.ADAPTIVE_EWMA_ALPHA
+    deviation = value - state["ewma"]
+    state["ewma"] += alpha * deviation
+    state["variance"] = (1 - alpha) * (state["variance"] + alpha * deviation * deviation)
+
+    change_threshold = state["change_threshold"]
+    spread_threshold = state["spread_threshold"]
+    triggered = False
+    if change_threshold is not None:
+        if abs(deviation) > change_threshold or state["variance"] > change_threshold * change_threshold:
+            triggered = True
+    if spread_threshold is not None and spread > spread_threshold:
+        triggered = True
+
+    if triggered:
+        if state["mode"] != EVENT:
+            print(f"[{utils.get_timestamp()}] [SAMPLER] {sensor_key}: Change detected (deviation {deviation:.2f}, spread {spread:.2f}). Switching to event sampling.")
+        state["mode"] = EVENT
+        state["hold"] = config.ADAPTIVE_EVENT_HOLD_SAMPLES
+    elif state["mode"] == EVENT:
+        state["hold"] -= 1
+        if state["hold"] <= 0:
+            print(f"[{utils.get_timestamp()}] [SAMPLER] {sensor_key}: Readings stable. Switching to steady sampling.")
+            state["mode"] = STEADY
+
+def get_statistics(sensor_key):
+    """Returns the (ewma, variance) of a sensor. ewma is None before the first value."""
+    state = _get_state(sensor_key)
+    return state["ewma"], state["variance"]
+
+def get_status(sensor_key):
+    """Returns the sampler state of a sensor for reporting."""
+    state = _get_state(sensor_key)
+    return {
+        "mode": state["mode"],
+        "ewma": round(state["ewma"], 2) if state["ewma"] is not None else None,
+        "variance": round(state["variance"], 2),
+        "period_s": get_period_s(sensor_key),
+    }
@@ -0,0 +1,250 @@
+import time
+import json
+import config
+import utils
+import adaptive_sampler
+
+# On-device alert rules, evaluated in O(1) for every processed sensor value.
+# Rules are taken from config.ALERT_RULES. Supported types:
+# - "threshold": fires when the value goes "above" or "below" a limit (one per rule).
+# - "rate": fires when the value changes faster than "max_change_per_min".
+# - "zscore": fires when the value deviates more than "z" standard deviations from the
+#   sensor's EWMA (using the adaptive sampler's running EWMA/variance), ignoring deviations
+#   smaller than the optional "min_deviation".
+# A fired rule clears once the value is back past the limit by "hysteresis", and does not
+# fire again within "cooldown_s" seconds of its last notification.
+# Notifications are queued and sent by send_pending_notifications() between HTTP requests,
+# so a slow or unreachable webhook/broker never stalls an acquisition.
+
+_rules_by_sensor = {}
+_rules = []
+# Queued (event, payload) notifications, oldest first
+_pending_notifications = []
+
+# Numeric keys required by each rule type. A threshold rule needs exactly one of "above" or
+# "below" instead; a lower and an upper limit are two separate rules.
+_REQUIRED_KEYS = {
+    "threshold": (),
+    "rate": ("max_change_per_min",),
+    "zscore": ("z",),
+}
+_OPTIONAL_KEYS = ("above", "below", "min_deviation", "hysteresis", "cooldown_s")
+
+def _validate_rule(rule):
+    """Raises ValueError unless a rule has a known type and all the keys that type needs."""
+    if not isinstance(rule, dict):
+        raise ValueError("Rule must be a dict")
+    for key in ("name", "sensor", "type"):
+        if key not in rule:
+            raise ValueError(f"Missing '{key}'")
+    if rule["type"] not in _REQUIRED_KEYS:
+        raise ValueError(f"Unknown type '{rule['type']}'")
+    if rule["type"] == "threshold" and ("above" in rule) == ("below" in rule):
+        raise ValueError("Threshold rule needs exactly one of 'above' or 'below'")
+    for key in _REQUIRED_KEYS[rule["type"]]:
+        if key not in rule:
+            raise ValueError(f"Missing '{key}'")
+    for key in _REQUIRED_KEYS[rule["type"]] + _OPTIONAL_KEYS:
+        if key in rule and (isinstance(rule[key], bool) or not isinstance(rule[key], (int, float))):
+            raise ValueError(f"'{key}' must be a number")
+
+def _load_rules():
+    """
+    Builds the rule states from config.ALERT_RULES, indexed by sensor.
+    Invalid rules are skipped so a configuration mistake never breaks sensor acquisition.
+    """
+    for rule in config.ALERT_RULES:
+        try:
+            _validate_rule(rule)
+        except ValueError as e:
+            print(f"[{utils.get_timestamp()}] [ALERTS] Skipping invalid rule {rule}: {e}")
+            continue
+        state = {
+            "rule": rule,
+            "active": False,
+            "notified": False,
+            "last_fired_ms": None,
+            "last_value": None,
+            "last_ticks_ms": None,
+        }
+        _rules.append(state)
+        _rules_by_sensor.setdefault(rule["sensor"], []).append(state)
+
+def _evaluate_metric(state, value):
+    """
+    Returns (metric, limit) for a rule, where the rule is violated when metric > limit.
+    Returns None if the rule cannot be evaluated yet.
+    """
+    rule = state["rule"]
+    rule_type = rule["type"]
+    if rule_type == "threshold":
+        if "above" in rule:
+            return value, rule["above"]
+        return -value, -rule["below"]
+    elif rule_type == "rate":
+        if state["last_ticks_ms"] is None:
+            return None
+        elapsed_ms = time.ticks_diff(time.ticks_ms(), state["last_ticks_ms"])
+        if elapsed_ms <= 0:
+            return None
+        rate_per_min = abs(value - state["last_value"]) * 60000 / elapsed_ms
+        return rate_per_min, rule["max_change_per_min"]
+    elif rule_type == "zscore":
+        ewma, variance = adaptive_sampler.get_statistics(rule["sensor"])
+        if ewma is None or variance <= 0:
+            return None
+        deviation = abs(value - ewma)
+        if deviation < rule.get("min_deviation", 0):
+            # Statistically unusual but too small to matter (e.g. on a very quiet sensor)
+            return 0, rule["z"]
+        return deviation / variance ** 0.5, rule["z"]
+    return None
+
+def evaluate(sensor_key, value):
+    """
+    Evaluates the rules of a sensor against a new processed value.
+    Must be called before the value is added to the adaptive sampler statistics.
+    """
+    states = _rules_by_sensor.get(sensor_key)
+    if not states or value is None:
+        return
+    now = time.ticks_ms()
+    for state in states:
+        try:
+            _evaluate_rule(state, value, now)
+        except Exception as e:
+            # One failing rule must not break the acquisition or the other rules
+            print(f"[{utils.get_timestamp()}] [ALERTS] Error evaluating {state['rule']['name']}: {e}")
+
+def _evaluate_rule(state, value, now):
+    """Evaluates one rule against a new value and fires or clears it."""
+    rule = state["rule"]
+    result = _evaluate_metric(state, value)
+    state["last_value"] = value
+    state["last_ticks_ms"] = now
+    if result is None:
+        return
+    metric, limit = result
+
+    if not state["active"]:
+        if metric <= limit:
+            return
+        state["active"] = True
+        cooldown_ms = rule.get("cooldown_s", config.ALERT_DEFAULT_COOLDOWN_S) * 1000
+        if state["last_fired_ms"] is not None and time.ticks_diff(now, state["last_fired_ms"]) < cooldown_ms:
+            print(f"[{utils.get_timestamp()}] [ALERTS] {rule['name']} triggered again within cooldown. Not notifying.")
+            state["notified"] = False
+            return
+        state["last_fired_ms"] = now
+        state["notified"] = True
+        _notify(rule, "fired", value, metric, limit)
+    elif metric < limit - rule.get("hysteresis", 0):
+        state["active"] = False
+        if state["notified"]:
+            _notify(rule, "cleared", value, metric, limit)
+
+def _notify(rule, event, value, metric, limit):
+    """
+    Logs an alert event and queues its notification. The oldest notification is dropped
+    when more than config.ALERT_MAX_QUEUED are waiting.
+    """
+    print(f"[{utils.get_timestamp()}] [ALERTS] {rule['name']} {event}: {rule['sensor']}={value} (metric {metric:.2f}, limit {limit})")
+    payload = json.dumps({
+        "rule": rule["name"],
+        "sensor": rule["sensor"],
+        "type": rule["type"],
+        "event": event,
+        "value": value,
+        "timestamp": utils.get_timestamp(),
+    })
+
+    if len(_pending_notifications) >= config.ALERT_MAX_QUEUED:
+        print(f"[{utils.get_timestamp()}] [ALERTS] Notification queue full. Dropping the oldest notification.")
+        _pending_notifications.pop(0)
+    _pending_notifications.append((event, payload))
+
+def send_pending_notifications(should_yield=None):
+    """
+    Pushes the queued notifications to the LED, the webhook and MQTT, oldest first.
+    Called by the HTTP server between requests. should_yield is an optional function
+    returning True when a client is waiting; the remaining notifications are then left
+    in the queue for the next call.
+    """
+    while _pending_notifications:
+        if should_yield and should_yield():
+            return
+        event, payload = _pending_notifications.pop(0)
+        if event == "fired":
+            try:
+                import led_signals
+                led_signals.signal_alert()
+            except ImportError:
+                pass
+
+        if config.ALERT_WEBHOOK_URL:
+            _send_webhook(payload)
+        if config.ALERT_MQTT_BROKER:
+            _publish_mqtt(payload)
+
+def _send_webhook(payload):
+    """POSTs the alert payload to config.ALERT_WEBHOOK_URL."""
+    try:
+        import urequests as requests
+    except ImportError:
+        try:
+            import requests
+        except ImportError:
+            print(f"[{utils.get_timestamp()}] [ALERTS] urequests library not found. Webhook not sent.")
+            return
+    try:
+        headers = {"Content-Type": "application/json"}
+        try:
+            response = requests.post(config.ALERT_WEBHOOK_URL, data=payload, headers=headers,
+                                     timeout=config.ALERT_NOTIFY_TIMEOUT_S)
+        except TypeError:
+            # Older urequests versions have no timeout
+            response = requests.post(config.ALERT_WEBHOOK_URL, data=payload, headers=headers)
+        print(f"[{utils.get_timestamp()}] [ALERTS] Webhook sent (status {response.status_code}).")
+        response.close()
+    except Exception as e:
+        print(f"[{utils.get_timestamp()}] [ALERTS] Error sending webhook: {e}")
+
+def _publish_mqtt(payload):
+    """Publishes the alert payload to config.ALERT_MQTT_TOPIC on config.ALERT_MQTT_BROKER."""
+    try:
+        from umqtt.simple import MQTTClient
+    except ImportError:
+        print(f"[{utils.get_timestamp()}] [ALERTS] umqtt.simple library not found. MQTT message not sent.")
+        return
+    try:
+        client = MQTTClient(config.ALERT_MQTT_CLIENT_ID, config.ALERT_MQTT_BROKER, port=config.ALERT_MQTT_PORT)
+        try:
+            client.connect(timeout=config.ALERT_NOTIFY_TIMEOUT_S)
+        except TypeError:
+            # Older umqtt.simple versions have no connect timeout
+            client.connect()
+        client.sock.settimeout(config.ALERT_NOTIFY_TIMEOUT_S)
+        client.publish(config.ALERT_MQTT_TOPIC, payload)
+        client.disconnect()
+        print(f"[{utils.get_timestamp()}] [ALERTS] MQTT message published to {config.ALERT_MQTT_TOPIC}.")
+    except Exception as e:
+        print(f"[{utils.get_timestamp()}] [ALERTS] Error publishing MQTT message: {e}")
+
+def get_status():
+    """Returns the state of every rule for reporting."""
+    status = []
+    for state in _rules:
+        rule = state["rule"]
+        last_fired_s = None
+        if state["last_fired_ms"] is not None:
+            last_fired_s = time.ticks_diff(time.ticks_ms(), state["last_fired_ms"]) // 1000
+        status.append({
+            "name": rule["name"],
+            "sensor": rule["sensor"],
+            "type": rule["type"],
+            "active": state["active"],
+            "last_fired_s_ago": last_fired_s,
+        })
+    return status
+
+_load_rules()
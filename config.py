@@ -7,10 +7,20 @@ HTTP_PORT = 80
 HTTP_MAX_PENDING_CONN = 5
 HTTP_CLIENT_TIMEOUT_S = 10
 HTTP_MAX_REQUEST_SIZE = 1024
+# Default time budget (ms) for sensor requests without a ?max_ms= parameter. 0 means no limit.
+HTTP_DEFAULT_DEADLINE_MS = 0
+
+# === Memory Settings ===
+# Allocated bytes after which MicroPython runs an automatic collection (0 disables it).
+GC_THRESHOLD_BYTES = 16384
+# Run a (timed) garbage collection after every request, while no client is waiting.
+GC_COLLECT_BETWEEN_REQUESTS = True
 
 # === Intervals ===
 MAIN_HEARTBEAT_INTERVAL_S = 5
 WIFI_RECONNECT_INTERVAL_S = 60
+# NTP is synchronized after the HTTP server is up; failed attempts are retried at this interval.
+NTP_RETRY_INTERVAL_S = 300
 
 # === Sensor Reading Configurations ===
 TEMP_NUM_READINGS = 5
@@ -25,6 +35,72 @@ TURB_READING_INTERVAL_S = 1
 TDS_NUM_READINGS = 5
 TDS_READING_INTERVAL_S = 1
 
+# A sensor value acquired less than this many seconds ago is served without a new reading.
+# With adaptive sampling enabled, values are instead served until the next scheduled sample.
+SENSOR_CACHE_MAX_AGE_S = 10
+# Percentage of successful readings needed for a good result (at least one reading is always
+# needed, so 0 accepts any single successful reading). The acquisition is aborted as soon as
+# too many readings have failed to reach it.
+SENSOR_MIN_VALID_PERCENT = 0
+# Size of the preallocated readings buffer of each sensor (upper bound for *_NUM_READINGS).
+SENSOR_MAX_READINGS = 15
+# Log every individual reading. Disabled to avoid formatting allocations on the sampling path.
+SENSOR_LOG_EACH_READING = False
+
+# === Adaptive Sampling Settings ===
+# When enabled, sensors are sampled in the background between HTTP requests. Sensors whose
+# values are flat are sampled rarely and with fewer readings; a change beyond the
+# *_CHANGE_THRESHOLD or a spread between readings beyond *_SPREAD_THRESHOLD switches
+# them to fast sampling with the full *_NUM_READINGS.
+ADAPTIVE_SAMPLING_ENABLED = True
+ADAPTIVE_EWMA_ALPHA = 0.2
+ADAPTIVE_STEADY_PERIOD_S = 600
+ADAPTIVE_STEADY_NUM_READINGS = 3
+ADAPTIVE_EVENT_PERIOD_S = 30
+ADAPTIVE_EVENT_HOLD_SAMPLES = 5
+SAMPLER_POLL_INTERVAL_S = 1
+
+TEMP_CHANGE_THRESHOLD = 0.5
+TEMP_SPREAD_THRESHOLD = 1.0
+DIST_CHANGE_THRESHOLD = 2.0
+DIST_SPREAD_THRESHOLD = 3.0
+TURB_CHANGE_THRESHOLD = 500
+TURB_SPREAD_THRESHOLD = 1000
+TDS_CHANGE_THRESHOLD = 300
+TDS_SPREAD_THRESHOLD = 600
+
+# === Rollup Settings ===
+# Resolutions (seconds) of the min/max/mean/count buckets kept per sensor and the
+# number of buckets retained for each one (1 h of minutes, 24 h of 15 min, 7 days of hours).
+ROLLUP_RESOLUTIONS_S = (60, 900, 3600)
+ROLLUP_BUCKETS = (60, 96, 168)
+
+# === Alert Settings ===
+# Rules evaluated on every processed sensor value. Types:
+#   "threshold": "above" or "below" a limit (one per rule; use two rules for a range)
+#   "rate": change faster than "max_change_per_min"
+#   "zscore": more than "z" standard deviations (and "min_deviation") from the sensor's EWMA
+# "hysteresis" is the margin by which the value must recover before the rule clears and
+# "cooldown_s" the minimum time between two notifications of the same rule.
+ALERT_RULES = [
+    {"name": "low_water", "sensor": "distance", "type": "threshold", "above": 40.0, "hysteresis": 2.0, "cooldown_s": 900},
+    {"name": "water_level_change", "sensor": "distance", "type": "rate", "max_change_per_min": 1.0, "hysteresis": 0.5, "cooldown_s": 900},
+    {"name": "turbidity_spike", "sensor": "turbidity", "type": "zscore", "z": 4.0, "min_deviation": 500, "hysteresis": 1.0, "cooldown_s": 900},
+    {"name": "temperature_high", "sensor": "temperature", "type": "threshold", "above": 30.0, "hysteresis": 1.0, "cooldown_s": 1800},
+    {"name": "temperature_low", "sensor": "temperature", "type": "threshold", "below": 4.0, "hysteresis": 1.0, "cooldown_s": 1800},
+]
+ALERT_DEFAULT_COOLDOWN_S = 600
+
+# Alert notifications. Leave empty to disable.
+ALERT_WEBHOOK_URL = ""
+ALERT_MQTT_BROKER = ""
+ALERT_MQTT_PORT = 1883
+ALERT_MQTT_TOPIC = "smartlago/alerts"
+ALERT_MQTT_CLIENT_ID = "smartlago"
+# Notifications are queued and sent between requests; each attempt gives up after this timeout.
+ALERT_NOTIFY_TIMEOUT_S = 2
+ALERT_MAX_QUEUED = 8
+
 # === Sensor Pins ===
 ONBOARD_LED_PIN = "LED"
 DS18B20_PIN = 18
@@ -34,7 +110,9 @@ TURBIDITY_ADC_PIN = 26
 TDS_ADC_PIN = 27
 
 # === Hardware Reset Settings ===
+# Also protects the /config endpoint.
 HARD_RESET_PASSWORD = "your_secret_password"
 
-
-print("Configurations loaded from config.py")
+# === Runtime Settings ===
+# Settings changed through /config are persisted in this file and applied at boot.
+SETTINGS_FILE = "settings.json"
@@ -1,9 +1,46 @@
 # --- Endpoints Documentation ---
 #
 # GET /status
-#   Returns the operational status of the device.
+#   Returns the operational status of the device, the boot timeline (ms since reset at
+#   which each boot phase was reached) and, with adaptive sampling enabled, the sampling
+#   mode of each sensor.
 #   Response:
-#     {"status": "ok"}
+#     {"status": "ok", "boot": {"reset_cause": "watchdog", "phases_ms": [["main", 812], ...]},
+#      "sampling": {"temperature": {"mode": "steady", "ewma": 21.8,
+#      "variance": 0.01, "period_s": 600}}}
+#
+# GET /rollups?sensor=<name>&res=<seconds>
+#   Returns the min/max/mean/count rollup buckets of one sensor, oldest first.
+#   sensor is required (one sensor per request keeps the response small); res is optional
+#   and defaults to the coarsest configured resolution.
+#   Response:
+#     {"sensor": "temperature", "resolution_s": 3600, "fields": ["start", "min", "max", "mean", "count"],
+#      "buckets": [[1700000000, 21.5, 22.0, 21.8, 12], ...]}
+#
+# GET /temperature, /distance, /turbidity, /tds (one route per registered sensor)
+#   Returns the current value of the sensor. The optional max_ms parameter (default
+#   HTTP_DEFAULT_DEADLINE_MS) limits the acquisition time; if no fresh value can be obtained
+#   in time, the last good value is returned as stale and refreshed in the background.
+#   Response:
+#     {"temperature": 21.8}
+#     {"temperature": 21.8, "stale": true, "age_s": 42}
+#   Fresh values carry an ETag (derived from the sample sequence number) and a
+#   Cache-Control max-age (time until the value is replaced). A request whose
+#   If-None-Match matches the current ETag is answered with a bodiless 304.
+#
+# GET /alerts
+#   Returns the state of the on-device alert rules (see ALERT_RULES in config.py).
+#   Response:
+#     {"alerts": [{"name": "low_water", "sensor": "distance", "type": "threshold",
+#                  "active": false, "last_fired_s_ago": null}]}
+#
+# GET /debug/mem
+#   Returns heap statistics (free/allocated bytes, largest allocatable block) and the
+#   pause times of the garbage collections run between requests.
+#   Response:
+#     {"free": 151232, "allocated": 40128, "largest_free_block": 120832,
+#      "gc": {"threshold": 16384, "collections": 42, "last_pause_us": 2150,
+#             "max_pause_us": 3410, "total_pause_us": 90112}}
 #
 # POST /hardreset
 #   Triggers a hardware reset of the device.
@@ -12,35 +49,138 @@
 #   Response:
 #     {"status": "ok", "message": "Device is resetting"}
 #
+# POST /config
+#   Returns the runtime-tunable settings (sample counts/intervals, HTTP limits, ...) and
+#   optionally validates, applies and persists new ones without a reboot, or restores the
+#   defaults. The password is sent in the body, as for /hardreset, so it never appears in URLs.
+#   Request Body (application/json):
+#     {"password": "your_secret_password"}
+#     {"password": "your_secret_password", "settings": {"DIST_NUM_READINGS": 3}}
+#     {"password": "your_secret_password", "reset": true}
+#   Response:
+#     {"status": "ok", "settings": {"TEMP_NUM_READINGS": 5, "TEMP_READING_INTERVAL_S": 1, ...}}
+#
 # ---
 import socket
+import select
+import errno
 import time
 import config
 import utils
 import sensor_manager
+import rollups
+import adaptive_sampler
+import alerts
 import wifi_manager
+import runtime_config
 import json
 
 route_handlers = {}
+_last_ntp_attempt_ms = None
+# Reused for every request instead of allocating a new receive buffer per connection
+_request_buffer = bytearray(config.HTTP_MAX_REQUEST_SIZE)
+_poller = select.poll()
+# Polls the listening socket, so idle work can give way to a client waiting to be accepted
+_server_poller = select.poll()
+
+# Statically allocated status lines, so building a response does not format them
+_STATUS_LINES = {
+    200: "HTTP/1.1 200 OK\r\n",
+    304: "HTTP/1.1 304 Not Modified\r\n",
+    400: "HTTP/1.1 400 Bad Request\r\n",
+    404: "HTTP/1.1 404 Not Found\r\n",
+    405: "HTTP/1.1 405 Method Not Allowed\r\n",
+    500: "HTTP/1.1 500 Internal Server Error\r\n",
+}
+
+def build_http_headers(status_code=200, content_length=0, content_type="application/json", headers=None):
+    """
+    Builds the status line and headers of an HTTP response.
+    headers is an optional dict of extra header names and values.
+    A 304 response has no content headers.
+    """
+    response = _STATUS_LINES.get(status_code) or f"HTTP/1.1 {status_code} OK\r\n"
+    if status_code != 304:
+        response += f"Content-Type: {content_type}\r\nContent-Length: {content_length}\r\n"
+    if headers:
+        for name, value in headers.items():
+            response += f"{name}: {value}\r\n"
+    return response + "Connection: close\r\n\r\n"
+
+def send_http_response(conn, body, status_code=200, content_type="application/json", headers=None):
+    """
+    Sends an HTTP response. The headers and the body are written separately, so the body
+    is never copied into a combined response string or re-encoded.
+    """
+    conn.sendall(build_http_headers(status_code, len(body), content_type, headers))
+    if body and status_code != 304:
+        conn.sendall(body)
+
+def parse_query_string(path):
+    """
+    Splits the query string from a request path.
+    Returns a tuple (path, query_params) where query_params is a dict of strings.
+    """
+    query_params = {}
+    query_index = path.find('?')
+    if query_index == -1:
+        return path, query_params
+
+    for pair in path[query_index + 1:].split('&'):
+        if not pair:
+            continue
+        key, _, value = pair.partition('=')
+        query_params[url_decode(key)] = url_decode(value)
+    return path[:query_index], query_params
+
+_HEX_DIGITS = "0123456789abcdefABCDEF"
 
-def build_http_response(body, status_code=200, content_type="application/json"):
-    """Builds an HTTP response string."""
-    status_description = "OK"
-    if status_code == 404:
-        status_description = "Not Found"
-    elif status_code == 500:
-        status_description = "Internal Server Error"
-    elif status_code == 400:
-        status_description = "Bad Request"
-    elif status_code == 405:
-        status_description = "Method Not Allowed"
-
-    response = f"HTTP/1.1 {status_code} {status_description}\r\n"
-    response += f"Content-Type: {content_type}\r\n"
-    response += f"Content-Length: {len(body)}\r\n"
-    response += "Connection: close\r\n\r\n"
-    response += body
-    return response.encode('utf-8')
+def url_decode(value):
+    """Decodes '+' and %XX escapes of a query string component."""
+    if '%' not in value and '+' not in value:
+        return value
+    value = value.replace('+', ' ')
+    parts = value.split('%')
+    decoded = bytearray(parts[0].encode())
+    for part in parts[1:]:
+        if len(part) >= 2 and part[0] in _HEX_DIGITS and part[1] in _HEX_DIGITS:
+            decoded.append(int(part[:2], 16))
+            decoded.extend(part[2:].encode())
+        else:
+            # Not a valid %XX escape: keep the '%' as a literal
+            decoded.extend(('%' + part).encode())
+    return decoded.decode()
+
+def get_header(request_data, name, header_end_index):
+    """
+    Returns the value of a request header, or None if it is absent.
+    name must be lowercase and include the colon (e.g. "if-none-match:"). The headers are
+    scanned in place up to header_end_index instead of being split into a list.
+    """
+    name_length = len(name)
+    line_start = request_data.find('\r\n') + 2
+    while 2 <= line_start < header_end_index:
+        line_end = request_data.find('\r\n', line_start)
+        if line_end == -1 or line_end > header_end_index:
+            line_end = header_end_index
+        if request_data[line_start:line_start + name_length].lower() == name:
+            return request_data[line_start + name_length:line_end].strip()
+        line_start = line_end + 2
+    return None
+
+def etag_matches(if_none_match, etag):
+    """Checks if an If-None-Match header value matches the given ETag."""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
 
 def handle_request(request_data, conn):
     """
@@ -51,64 +191,113 @@ def handle_request(request_data, conn):
         if header_end_index == -1:
             raise ValueError("Invalid HTTP headers")
 
-        header_str = request_data[:header_end_index]
-        body_str = request_data[header_end_index + 4:]
-
-        request_lines = header_str.split('\r\n')
-        if not request_lines:
-            raise ValueError("Empty request")
-
-        request_line = request_lines[0]
-        parts = request_line.split()
-        if len(parts) < 2:
+        # Parse the request line in place instead of splitting the headers into lists
+        request_line_end = request_data.find('\r\n')
+        method_end = request_data.find(' ', 0, request_line_end)
+        path_end = request_data.find(' ', method_end + 1, request_line_end)
+        if method_end <= 0:
             raise ValueError("Malformed request line")
+        if path_end == -1:
+            path_end = request_line_end
 
-        method, path = parts[0], parts[1]
+        method = request_data[:method_end]
+        path = request_data[method_end + 1:path_end]
+        if not path:
+            raise ValueError("Malformed request line")
+        path, query_params = parse_query_string(path)
 
     except ValueError as e:
         print(f"[{utils.get_timestamp()}] [HTTP_SERVER] Error parsing request: {e}")
-        response_body = '{"error": "Bad Request", "detail": "Malformed request"}'
-        response = build_http_response(response_body, status_code=400)
-        conn.sendall(response)
+        send_http_response(conn, '{"error": "Bad Request", "detail": "Malformed request"}', status_code=400)
         return
 
     print(f"[{utils.get_timestamp()}] [HTTP_SERVER] Received {method} for {path}")
 
-    handler, allowed_methods = route_handlers.get(path, (None, []))
+    route = route_handlers.get(path, (None, []))
+    handler, allowed_methods = route[0], route[1]
+    validator = route[2] if len(route) > 2 else None
+    status_code = 200
+    response_headers = None
 
     if handler:
         if method in allowed_methods:
             try:
-                if method == "POST":
-                    # For POST, pass the body to the handler
-                    response_data = handler(body_str)
+                cache_state = validator() if validator and method == "GET" else None
+                if cache_state and etag_matches(get_header(request_data, "if-none-match:", header_end_index), cache_state[0]):
+                    # The client already has the current value: answer without running the handler
+                    print(f"[{utils.get_timestamp()}] [HTTP_SERVER] {path} not modified")
+                    status_code = 304
+                    response_body_json = ""
+                    response_headers = {
+                        "ETag": cache_state[0],
+                        "Cache-Control": f"max-age={cache_state[1]}"}
                 else:
-                    # For GET, call handler without arguments
-                    response_data = handler()
+                    if method == "POST":
+                        # For POST, pass the body to the handler
+                        response_data = handler(request_data[header_end_index + 4:])
+                    else:
+                        # For GET, pass the parsed query string parameters
+                        response_data = handler(query_params)
 
-                if response_data is None:
-                    response_body_json = '{"error": "No data or failed operation"}'
-                    response = build_http_response(response_body_json, status_code=500)
-                else:
-                    response_body_json = json.dumps(response_data)
-                    response = build_http_response(response_body_json)
+                    if response_data is None:
+                        response_body_json = '{"error": "No data or failed operation"}'
+                        status_code = 500
+                    else:
+                        response_body_json = json.dumps(response_data)
+                        if validator:
+                            cache_state = validator()
+                            if cache_state and not response_data.get("stale"):
+                                response_headers = {
+                                    "ETag": cache_state[0],
+                                    "Cache-Control": f"max-age={cache_state[1]}"}
+                            else:
+                                response_headers = {"Cache-Control": "no-cache"}
 
             except Exception as e:
                 print(f"[{utils.get_timestamp()}] [HTTP_SERVER] Error in handler for {path}: {e}")
                 response_body_json = f'{{"error": "Internal Server Error", "detail": "{str(e)}"}}'
-                response = build_http_response(response_body_json, status_code=500)
+                status_code = 500
+                response_headers = None
         else:
             response_body_json = '{"error": "Method Not Allowed"}'
-            response = build_http_response(response_body_json, status_code=405)
+            status_code = 405
     else:
         response_body_json = '{"error": "Not Found"}'
-        response = build_http_response(response_body_json, status_code=404)
+        status_code = 404
 
     try:
-        conn.sendall(response)
+        send_http_response(conn, response_body_json, status_code=status_code, headers=response_headers)
     except OSError as e:
         print(f"[{utils.get_timestamp()}] [HTTP_SERVER] OSError sending response for {path}: {e}")
 
+def _read_request(conn):
+    """
+    Waits for the request data of a connection and reads it into the preallocated request
+    buffer. Returns the request as a string, or None on timeout or empty request.
+    """
+    global _request_buffer
+    if len(_request_buffer) != config.HTTP_MAX_REQUEST_SIZE:
+        _request_buffer = bytearray(config.HTTP_MAX_REQUEST_SIZE)
+
+    _poller.register(conn, select.POLLIN)
+    try:
+        ready = False
+        for _ in _poller.ipoll(config.HTTP_CLIENT_TIMEOUT_S * 1000, 1):
+            ready = True
+        if not ready:
+            print(f"[{utils.get_timestamp()}] [HTTP_SERVER] Timeout waiting for request data.")
+            return None
+        # Read whatever has arrived without blocking until the buffer is full
+        conn.settimeout(0)
+        num_bytes = conn.readinto(_request_buffer)
+    finally:
+        _poller.unregister(conn)
+        conn.settimeout(config.HTTP_CLIENT_TIMEOUT_S)
+
+    if not num_bytes:
+        return None
+    return str(memoryview(_request_buffer)[:num_bytes], 'utf-8')
+
 def start_server():
     """
     Initializes the HTTP server and enters the listening loop for connections.
@@ -123,11 +312,17 @@ def start_server():
         server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         server_socket.bind(addr_info)
         server_socket.listen(config.HTTP_MAX_PENDING_CONN)
+        # Wake up periodically to run background sampling and stale value refreshes.
+        server_socket.settimeout(config.SAMPLER_POLL_INTERVAL_S)
+        _server_poller.register(server_socket, select.POLLIN)
         print(f"[{utils.get_timestamp()}] [HTTP_SERVER] Listening on {wifi_manager.get_ip()}:{config.HTTP_PORT}")
+        utils.mark_boot_phase("server_listening")
     except Exception as e:
         print(f"[{utils.get_timestamp()}] [HTTP_SERVER] Error binding/listening on socket: {e}")
         return
 
+    utils.configure_gc()
+
     while True:
         client_conn = None
         try:
@@ -135,63 +330,197 @@ def start_server():
             client_conn.settimeout(config.HTTP_CLIENT_TIMEOUT_S)
             print(f"[{utils.get_timestamp()}] [HTTP_SERVER] Connection from {addr[0]}:{addr[1]}")
 
-            request_bytes = client_conn.recv(config.HTTP_MAX_REQUEST_SIZE)
-            if request_bytes:
-                handle_request(request_bytes.decode('utf-8'), client_conn)
+            request_data = _read_request(client_conn)
+            if request_data:
+                handle_request(request_data, client_conn)
+                utils.mark_boot_phase("first_response")
 
         except OSError as e:
-            print(f"[{utils.get_timestamp()}] [HTTP_SERVER] Connection error: {e}")
+            # A timeout without a connection just means the poll interval elapsed
+            if client_conn is not None or e.args[0] not in (errno.ETIMEDOUT, errno.EAGAIN):
+                print(f"[{utils.get_timestamp()}] [HTTP_SERVER] Connection error: {e}")
         finally:
             if client_conn:
                 client_conn.close()
 
-# --- Route Handlers ---
-def handle_status_request():
+        if client_conn and config.GC_COLLECT_BETWEEN_REQUESTS:
+            # Collect while no client is waiting, instead of in the middle of the next request
+            utils.collect_garbage()
+
+        run_idle_tasks()
+
+def is_client_waiting():
+    """Checks, without blocking, if a client connection is waiting to be accepted."""
+    for _ in _server_poller.ipoll(0):
+        return True
+    return False
+
+def run_idle_tasks():
     """
-    Handles requests to the /status endpoint, returning a simple OK message.
+    Runs the deferred work between requests: the NTP synchronization that was skipped at boot,
+    the queued alert notifications and the background sampling of (at most) one due sensor.
+    Nothing is started while a client is waiting, and a sensor acquisition is interrupted as
+    soon as one connects.
     """
-    return {"status": "ok"}
+    global _last_ntp_attempt_ms
+    if is_client_waiting():
+        return
+    if wifi_manager.time_sync_pending:
+        now = time.ticks_ms()
+        if _last_ntp_attempt_ms is None or time.ticks_diff(now, _last_ntp_attempt_ms) >= config.NTP_RETRY_INTERVAL_S * 1000:
+            _last_ntp_attempt_ms = now
+            wifi_manager.sync_ntp_time()
+    alerts.send_pending_notifications(is_client_waiting)
+    sensor_manager.run_scheduled_sampling(is_client_waiting)
 
-def handle_temperature_request():
-    result = sensor_manager.read_specific_sensor("temperature")
-    return { "temperature": result.get("value") } if result and result.get("value") is not None else None
+# --- Route Handlers ---
+def handle_status_request(query_params=None):
+    """
+    Handles requests to the /status endpoint, returning an OK message, the boot timeline
+    and, when adaptive sampling is enabled, the sampling mode of each sensor.
+    """
+    response = {
+        "status": "ok",
+        "boot": {"reset_cause": utils.get_reset_cause(), "phases_ms": utils.get_boot_timeline()}}
+    if config.ADAPTIVE_SAMPLING_ENABLED:
+        sampling = {}
+        for sensor_name in sensor_manager.get_sensor_keys():
+            if sensor_manager.is_sensor_available(sensor_name):
+                sampling[sensor_name] = adaptive_sampler.get_status(sensor_name)
+        response["sampling"] = sampling
+    return response
 
-def handle_distance_request():
-    result = sensor_manager.read_specific_sensor("distance")
-    return { "distance": result.get("value") } if result and result.get("value") is not None else None
+def get_request_deadline(query_params):
+    """
+    Returns the deadline of a sensor request as a time.ticks_ms() value, taken from the
+    max_ms query parameter or config.HTTP_DEFAULT_DEADLINE_MS. Returns None for no deadline.
+    """
+    max_ms = config.HTTP_DEFAULT_DEADLINE_MS
+    if query_params and "max_ms" in query_params:
+        try:
+            max_ms = int(query_params["max_ms"])
+        except ValueError:
+            raise ValueError("Invalid max_ms")
+    if max_ms <= 0:
+        return None
+    return time.ticks_add(time.ticks_ms(), max_ms)
 
-def handle_turbidity_request():
-    result = sensor_manager.read_specific_sensor("turbidity")
-    return { "turbidity": result.get("value") } if result and result.get("value") is not None else None
+def make_sensor_handler(sensor_name):
+    """
+    Creates the GET handler for a registered sensor, returning {sensor_name: value}.
+    """
+    def handle_sensor_request(query_params=None):
+        deadline_ms = get_request_deadline(query_params)
+        result = sensor_manager.read_specific_sensor(sensor_name, deadline_ms=deadline_ms)
+        if not result or result.get("value") is None:
+            return None
+        response = { sensor_name: result.get("value") }
+        if result.get("stale"):
+            response["stale"] = True
+            response["age_s"] = result.get("age_s")
+        return response
+    return handle_sensor_request
 
-def handle_tds_request():
-    result = sensor_manager.read_specific_sensor("tds")
-    return { "tds": result.get("value") } if result and result.get("value") is not None else None
+def make_sensor_validator(sensor_name):
+    """
+    Creates the conditional GET validator for a registered sensor.
+    """
+    def validate_sensor_request():
+        return sensor_manager.get_cache_validator(sensor_name)
+    return validate_sensor_request
 
-def handle_hard_reset_request(request_body):
+def handle_rollups_request(query_params=None):
     """
-    Handles requests to the /hardreset endpoint.
-    Requires a POST request with a JSON body containing the correct password.
+    Handles requests to the /rollups endpoint, returning the aggregated buckets
+    of one registered sensor at a single resolution.
     """
+    query_params = query_params or {}
+    sensor = query_params.get("sensor")
+    if not sensor:
+        raise ValueError("Missing sensor")
+    if sensor_manager.get_driver(sensor) is None:
+        raise ValueError(f"Unknown sensor '{sensor}'")
     try:
-        data = json.loads(request_body)
-        password = data.get("password")
-    except json.JSONDecodeError:
-        raise ValueError("Invalid JSON")
+        resolution_s = int(query_params.get("res", config.ROLLUP_RESOLUTIONS_S[-1]))
+    except ValueError:
+        raise ValueError("Invalid resolution")
+    if resolution_s not in config.ROLLUP_RESOLUTIONS_S:
+        raise ValueError(f"Resolution must be one of {list(config.ROLLUP_RESOLUTIONS_S)}")
 
-    if password == config.HARD_RESET_PASSWORD:
-        utils.hard_reset()
-        return {"status": "ok", "message": "Device is resetting"}
-    else:
+    return {
+        "sensor": sensor,
+        "resolution_s": resolution_s,
+        "fields": ["start", "min", "max", "mean", "count"],
+        "buckets": rollups.get_rollups(sensor, resolution_s)}
+
+def handle_alerts_request(query_params=None):
+    """
+    Handles requests to the /alerts endpoint, returning the state of every alert rule.
+    """
+    return {"alerts": alerts.get_status()}
+
+def handle_debug_mem_request(query_params=None):
+    """
+    Handles requests to the /debug/mem endpoint, returning heap and GC statistics.
+    """
+    return utils.get_memory_stats()
+
+def check_password(password):
+    """Raises ValueError("Unauthorized") unless the password matches HARD_RESET_PASSWORD."""
+    if password != config.HARD_RESET_PASSWORD:
         # Note: In a real-world scenario, you might want to handle this more securely
         # to prevent timing attacks, but for this context, it's acceptable.
         raise ValueError("Unauthorized")
 
+def parse_authenticated_body(request_body):
+    """
+    Parses a JSON request body and checks its "password" field.
+    Returns the parsed data.
+    """
+    try:
+        data = json.loads(request_body)
+    except ValueError:
+        raise ValueError("Invalid JSON")
+    if not isinstance(data, dict):
+        raise ValueError("Invalid JSON")
+    check_password(data.get("password"))
+    return data
+
+def handle_hard_reset_request(request_body):
+    """
+    Handles requests to the /hardreset endpoint.
+    Requires a POST request with a JSON body containing the correct password.
+    """
+    parse_authenticated_body(request_body)
+    utils.hard_reset()
+    return {"status": "ok", "message": "Device is resetting"}
+
+def handle_config_request(request_body):
+    """
+    Handles requests to the /config endpoint.
+    Requires a POST request with a JSON body containing the correct password, and optionally
+    "settings", a dict of settings to validate, apply and persist, or "reset": true to restore
+    the defaults. Returns the current tunable settings.
+    """
+    data = parse_authenticated_body(request_body)
+    if data.get("reset"):
+        runtime_config.reset_settings()
+    elif "settings" in data:
+        settings = runtime_config.validate_settings(data["settings"])
+        runtime_config.apply_settings(settings)
+        runtime_config.save_settings()
+    return {"status": "ok", "settings": runtime_config.get_settings()}
+
 # --- Route Registration ---
-# Each route is a tuple of (handler_function, allowed_methods)
+# Each route is a tuple of (handler_function, allowed_methods) or
+# (handler_function, allowed_methods, validator_function). The validator returns
+# (etag, max_age_s) for a cacheable response, or None, and enables conditional GET.
 route_handlers["/status"] = (handle_status_request, ["GET"])
-route_handlers["/temperature"] = (handle_temperature_request, ["GET"])
-route_handlers["/distance"] = (handle_distance_request, ["GET"])
-route_handlers["/turbidity"] = (handle_turbidity_request, ["GET"])
-route_handlers["/tds"] = (handle_tds_request, ["GET"])
+for sensor_name in sensor_manager.get_sensor_keys():
+    route_handlers["/" + sensor_name] = (
+        make_sensor_handler(sensor_name), ["GET"], make_sensor_validator(sensor_name))
+route_handlers["/rollups"] = (handle_rollups_request, ["GET"])
+route_handlers["/alerts"] = (handle_alerts_request, ["GET"])
+route_handlers["/debug/mem"] = (handle_debug_mem_request, ["GET"])
 route_handlers["/hardreset"] = (handle_hard_reset_request, ["POST"])
+route_handlers["/config"] = (handle_config_request, ["POST"])
@@ -19,7 +19,6 @@ def signal_script_start():
     """Signals that the main script has started running."""
     print("[LED] Signal: Script start")
     _blink_led(count=3, on_duration=0.05, off_duration=0.05)
-    time.sleep(0.5)
 
 def signal_wifi_status(connected: bool):
     """Signals the Wi-Fi connection status."""
@@ -50,6 +49,11 @@ def signal_general_error():
         _blink_led(count=3, on_duration=0.05, off_duration=0.05) # S
         time.sleep(0.3)
 
+def signal_alert():
+    """Signals that an alert rule has fired."""
+    print("[LED] Signal: Alert")
+    _blink_led(count=5, on_duration=0.05, off_duration=0.05)
+
 def signal_sensor_reading_in_progress():
     """Signals that sensor reading is in progress."""
     print("[LED] Signal: Reading sensors...")
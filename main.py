@@ -1,15 +1,26 @@
 import time
-import config
 import utils
+utils.mark_boot_phase("main")
+import config
+import runtime_config
 import wifi_manager
+import sensor_manager
 import http_server
 import led_signals
+utils.mark_boot_phase("imports_done")
 
-if __name__ == "__main__":
+def run():
+    """
+    Connects to Wi-Fi and runs the HTTP server forever.
+    Sensors are initialized while the Wi-Fi join is in progress, and NTP synchronization
+    is deferred until the server is listening. Kept in a function so a frozen build can
+    start it with `import main; main.run()`.
+    """
+    runtime_config.load_settings()
     led_signals.signal_script_start()
 
     print(f"[{utils.get_timestamp()}] Attempting initial Wi-Fi connection to '{config.WIFI_SSID}'...")
-    if wifi_manager.connect_wifi(config.WIFI_SSID, config.WIFI_PASSWORD):
+    if wifi_manager.connect_wifi(config.WIFI_SSID, config.WIFI_PASSWORD, sync_time=False, on_wait=sensor_manager.init_sensors):
         led_signals.signal_wifi_status(True)
         print(f"[{utils.get_timestamp()}] Wi-Fi connected successfully.")
     else:
@@ -32,8 +43,11 @@ if __name__ == "__main__":
             print(f"[{utils.get_timestamp()}] Wi-Fi disconnected. Attempting to reconnect...")
             led_signals.signal_wifi_status(False)
 
-            if wifi_manager.connect_wifi(config.WIFI_SSID, config.WIFI_PASSWORD, attempts=2, connection_timeout=10):
+            if wifi_manager.connect_wifi(config.WIFI_SSID, config.WIFI_PASSWORD, attempts=2, connection_timeout=10, sync_time=False):
                 print(f"[{utils.get_timestamp()}] Wi-Fi reconnected successfully.")
             else:
                 print(f"[{utils.get_timestamp()}] Failed to reconnect Wi-Fi. Retrying after {config.WIFI_RECONNECT_INTERVAL_S}s...")
                 time.sleep(config.WIFI_RECONNECT_INTERVAL_S)
+
+if __name__ == "__main__":
+    run()
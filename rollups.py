@@ -0,0 +1,83 @@
+import time
+import array
+import config
+
+# Per-sensor rollup buckets kept in fixed-size ring buffers.
+# For every sensor and every resolution in config.ROLLUP_RESOLUTIONS_S there is one ring
+# of config.ROLLUP_BUCKETS[i] buckets. Each bucket stores the bucket index (time // resolution),
+# min, max, sum and count, so recording a sample is O(1) and never allocates.
+
+_rings = {}
+
+def _new_ring(num_buckets):
+    """Creates the preallocated arrays for one resolution."""
+    return {
+        "epoch": array.array('l', [-1] * num_buckets),
+        "min": array.array('f', [0.0] * num_buckets),
+        "max": array.array('f', [0.0] * num_buckets),
+        "sum": array.array('f', [0.0] * num_buckets),
+        "count": array.array('H', [0] * num_buckets),
+    }
+
+def _get_rings(sensor_key):
+    """Returns the rings for a sensor, allocating them on its first sample."""
+    rings = _rings.get(sensor_key)
+    if rings is None:
+        rings = [_new_ring(n) for n in config.ROLLUP_BUCKETS]
+        _rings[sensor_key] = rings
+    return rings
+
+def record(sensor_key, value, timestamp=None):
+    """Adds a processed sensor value to every rollup resolution of the sensor."""
+    if value is None:
+        return
+    now = int(time.time() if timestamp is None else timestamp)
+    value = float(value)
+    rings = _get_rings(sensor_key)
+    for i in range(len(rings)):
+        ring = rings[i]
+        epoch = now // config.ROLLUP_RESOLUTIONS_S[i]
+        slot = epoch % len(ring["epoch"])
+        if ring["epoch"][slot] != epoch:
+            ring["epoch"][slot] = epoch
+            ring["min"][slot] = value
+            ring["max"][slot] = value
+            ring["sum"][slot] = value
+            ring["count"][slot] = 1
+            continue
+        if value < ring["min"][slot]:
+            ring["min"][slot] = value
+        if value > ring["max"][slot]:
+            ring["max"][slot] = value
+        ring["sum"][slot] += value
+        if ring["count"][slot] < 65535:
+            ring["count"][slot] += 1
+
+def get_rollups(sensor_key, resolution_s, now=None):
+    """
+    Returns the valid buckets of a sensor at the given resolution, oldest first.
+    Each bucket is [start_timestamp, min, max, mean, count].
+    Returns None if the resolution is not configured.
+    """
+    if resolution_s not in config.ROLLUP_RESOLUTIONS_S:
+        return None
+    rings = _rings.get(sensor_key)
+    if rings is None:
+        return []
+    ring = rings[config.ROLLUP_RESOLUTIONS_S.index(resolution_s)]
+    num_buckets = len(ring["epoch"])
+    current_epoch = int(time.time() if now is None else now) // resolution_s
+
+    buckets = []
+    for epoch in range(current_epoch - num_buckets + 1, current_epoch + 1):
+        slot = epoch % num_buckets
+        if ring["epoch"][slot] != epoch:
+            continue
+        count = ring["count"][slot]
+        buckets.append([
+            epoch * resolution_s,
+            round(ring["min"][slot], 2),
+            round(ring["max"][slot], 2),
+            round(ring["sum"][slot] / count, 2),
+            count])
+    return buckets
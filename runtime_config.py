@@ -0,0 +1,108 @@
+import os
+import json
+import config
+import utils
+
+# Settings that can be changed at runtime through the /config endpoint.
+# Each entry maps a config attribute to (allowed types, minimum, maximum). Values are applied
+# to the config module directly, so every reader picks them up on its next use, and the
+# settings that differ from the defaults in config.py are persisted to config.SETTINGS_FILE.
+TUNABLE_SETTINGS = {
+    "TEMP_NUM_READINGS": ((int,), 1, config.SENSOR_MAX_READINGS),
+    "TEMP_READING_INTERVAL_S": ((int, float), 0, 60),
+    "DIST_NUM_READINGS": ((int,), 1, config.SENSOR_MAX_READINGS),
+    "DIST_READING_INTERVAL_S": ((int, float), 0, 60),
+    "TURB_NUM_READINGS": ((int,), 1, config.SENSOR_MAX_READINGS),
+    "TURB_READING_INTERVAL_S": ((int, float), 0, 60),
+    "TDS_NUM_READINGS": ((int,), 1, config.SENSOR_MAX_READINGS),
+    "TDS_READING_INTERVAL_S": ((int, float), 0, 60),
+    "SENSOR_CACHE_MAX_AGE_S": ((int,), 0, 3600),
+    "ADAPTIVE_STEADY_PERIOD_S": ((int,), 1, 86400),
+    "ADAPTIVE_STEADY_NUM_READINGS": ((int,), 1, config.SENSOR_MAX_READINGS),
+    "ADAPTIVE_EVENT_PERIOD_S": ((int,), 1, 86400),
+    "HTTP_DEFAULT_DEADLINE_MS": ((int,), 0, 60000),
+    "HTTP_MAX_REQUEST_SIZE": ((int,), 256, 8192),
+    "HTTP_CLIENT_TIMEOUT_S": ((int,), 1, 60),
+}
+
+_defaults = {}
+for _name in TUNABLE_SETTINGS:
+    _defaults[_name] = getattr(config, _name)
+
+def validate_settings(settings):
+    """
+    Validates a dict of setting names and values.
+    Returns the validated dict; raises ValueError on the first invalid entry.
+    """
+    if not isinstance(settings, dict):
+        raise ValueError("Settings must be a JSON object")
+    validated = {}
+    for name, value in settings.items():
+        if name not in TUNABLE_SETTINGS:
+            raise ValueError(f"Unknown setting '{name}'")
+        types, minimum, maximum = TUNABLE_SETTINGS[name]
+        if isinstance(value, bool) or not isinstance(value, types):
+            raise ValueError(f"Invalid type for '{name}'")
+        if value < minimum or value > maximum:
+            raise ValueError(f"'{name}' must be between {minimum} and {maximum}")
+        validated[name] = value
+    return validated
+
+def apply_settings(settings):
+    """Applies already validated settings to the config module."""
+    for name, value in settings.items():
+        setattr(config, name, value)
+        print(f"[{utils.get_timestamp()}] [CONFIG] {name} = {value}")
+
+def get_settings():
+    """Returns the current value of every tunable setting."""
+    current = {}
+    for name in TUNABLE_SETTINGS:
+        current[name] = getattr(config, name)
+    return current
+
+def save_settings():
+    """
+    Persists the settings that differ from the config.py defaults to flash.
+    The file is written to a temporary name first so a reset never leaves it truncated.
+    """
+    overrides = {}
+    for name in TUNABLE_SETTINGS:
+        value = getattr(config, name)
+        if value != _defaults[name]:
+            overrides[name] = value
+    temp_file = config.SETTINGS_FILE + ".tmp"
+    with open(temp_file, "w") as f:
+        json.dump(overrides, f)
+    os.rename(temp_file, config.SETTINGS_FILE)
+
+def reset_settings():
+    """Restores the config.py defaults and removes the persisted settings."""
+    apply_settings(_defaults)
+    try:
+        os.remove(config.SETTINGS_FILE)
+    except OSError:
+        pass
+
+def load_settings():
+    """
+    Loads and applies the settings persisted on flash, if any.
+    Invalid entries are skipped so a bad file never prevents booting.
+    """
+    try:
+        with open(config.SETTINGS_FILE) as f:
+            settings = json.load(f)
+    except OSError:
+        return
+    except ValueError as e:
+        print(f"[{utils.get_timestamp()}] [CONFIG] Ignoring invalid settings file: {e}")
+        return
+
+    if not isinstance(settings, dict):
+        print(f"[{utils.get_timestamp()}] [CONFIG] Ignoring invalid settings file.")
+        return
+    for name, value in settings.items():
+        try:
+            apply_settings(validate_settings({name: value}))
+        except ValueError as e:
+            print(f"[{utils.get_timestamp()}] [CONFIG] Skipping persisted setting: {e}")
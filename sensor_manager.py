@@ -1,6 +1,10 @@
 import time
+import array
 import config
 import utils
+import rollups
+import adaptive_sampler
+import alerts
 import machine
 import urandom
 
@@ -10,75 +14,197 @@ hcsr04_sensor_pins = None
 turbidity_adc = None
 tds_adc = None
 
-try:
-    import onewire
-    import ds18x20
-    ow_pin = machine.Pin(config.DS18B20_PIN)
-    ow_bus = onewire.OneWire(ow_pin)
-    ds_sensor = ds18x20.DS18X20(ow_bus)
-    roms = ds_sensor.scan()
-    if not roms:
-        print(f"[{utils.get_timestamp()}] No DS18B20 sensor found on pin {config.DS18B20_PIN}.")
+# --- Driver Registry ---
+# Each sensor is described by a driver entry, keyed by the sensor name used in the HTTP
+# routes and in the data returned by read_all_sensors(). Acquisition, routing, rollups,
+# adaptive sampling and caching all go through this table.
+_drivers = {}
+_driver_order = []
+# Index in _driver_order at which run_scheduled_sampling() resumes its round-robin scan
+_next_scheduled_index = 0
+# Random per-boot prefix of the ETags, so sequence numbers restarting after a reset
+# never validate a response cached before it.
+_etag_prefix = "%04x" % urandom.getrandbits(16)
+
+def register_driver(key, name, init, read, unit, num_readings_setting, reading_interval_setting,
+                    change_threshold=None, spread_threshold=None, start=None, conversion_ms=0,
+                    burst=None, convert=None, typecode='f'):
+    """
+    Registers a sensor driver.
+    - init: function that initializes the hardware and returns True if the sensor is available.
+    - read: function that returns one raw reading, or None on failure.
+    - start: optional function that triggers a conversion. When given, read() only fetches
+      the result and the conversion_ms wait is overlapped with the reading interval.
+    - burst: optional function(buffer, n) that stores up to n raw readings in buffer and
+      returns how many were stored, used when the reading interval is zero.
+    - convert: optional function applied to the final central value.
+    - num_readings_setting / reading_interval_setting: names of the config attributes holding
+      the sampling policy, read at acquisition time so runtime changes apply immediately.
+    - change_threshold / spread_threshold: adaptive sampling thresholds (see adaptive_sampler).
+    - typecode: array typecode of the preallocated readings buffer ('f' for floats, 'H' for
+      raw 16-bit ADC values).
+    """
+    if key not in _drivers:
+        _driver_order.append(key)
+    _drivers[key] = {
+        "key": key,
+        "name": name,
+        "init": init,
+        "read": read,
+        "start": start,
+        "conversion_ms": conversion_ms,
+        "burst": burst,
+        "convert": convert,
+        "unit": unit,
+        "num_readings_setting": num_readings_setting,
+        "reading_interval_setting": reading_interval_setting,
+        "available": None,
+        "last_value": None,
+        "last_ticks_ms": None,
+        "sequence": 0,
+        "buffer": array.array(typecode, [0] * config.SENSOR_MAX_READINGS),
+        "refresh_pending": False,
+    }
+    adaptive_sampler.set_thresholds(key, change_threshold, spread_threshold)
+
+def get_driver(key):
+    """Returns the driver registered for a sensor name, or None."""
+    return _drivers.get(key)
+
+def get_sensor_keys():
+    """Returns the registered sensor names in registration order."""
+    return _driver_order
+
+def _ensure_initialized(driver):
+    """
+    Initializes the hardware of a driver on first use.
+    Returns True if the sensor is available.
+    """
+    if driver["available"] is None:
+        try:
+            driver["available"] = bool(driver["init"]())
+        except Exception as e:
+            print(f"[{utils.get_timestamp()}] Error initializing {driver['name']} sensor: {e}")
+            driver["available"] = False
+    return driver["available"]
+
+def init_sensors():
+    """
+    Initializes the hardware of every registered driver that was not initialized yet.
+    Hardware is otherwise initialized lazily on first use, so this can be called while
+    waiting for the Wi-Fi connection.
+    """
+    for key in _driver_order:
+        _ensure_initialized(_drivers[key])
+    utils.mark_boot_phase("sensors_initialized")
+
+def is_sensor_available(sensor_name: str):
+    """Checks if the hardware for the given sensor was initialized successfully."""
+    driver = _drivers.get(sensor_name)
+    return bool(driver and driver["available"])
+
+# --- Hardware Initialization ---
+def _init_ds18b20():
+    """Scans the 1-Wire bus for a DS18B20 sensor."""
+    global ds_sensor, roms
+    try:
+        import onewire
+        import ds18x20
+        ow_pin = machine.Pin(config.DS18B20_PIN)
+        ow_bus = onewire.OneWire(ow_pin)
+        ds_sensor = ds18x20.DS18X20(ow_bus)
+        roms = ds_sensor.scan()
+        if not roms:
+            print(f"[{utils.get_timestamp()}] No DS18B20 sensor found on pin {config.DS18B20_PIN}.")
+            ds_sensor = None
+        else:
+            print(f"[{utils.get_timestamp()}] DS18B20 sensor initialized on pin {config.DS18B20_PIN}.")
+    except ImportError:
+        print(f"[{utils.get_timestamp()}] onewire/ds18x20 libraries not found.")
         ds_sensor = None
-    else:
-        print(f"[{utils.get_timestamp()}] DS18B20 sensor initialized on pin {config.DS18B20_PIN}.")
-except ImportError:
-    print(f"[{utils.get_timestamp()}] onewire/ds18x20 libraries not found.")
-    ds_sensor = None
-except Exception as e:
-    print(f"[{utils.get_timestamp()}] Error initializing DS18B20 sensor: {e}")
-    ds_sensor = None
-
-try:
-    trigger_pin = machine.Pin(config.HCSR04_TRIGGER_PIN, machine.Pin.OUT)
-    echo_pin = machine.Pin(config.HCSR04_ECHO_PIN, machine.Pin.IN)
-    hcsr04_sensor_pins = {"trigger": trigger_pin, "echo": echo_pin}
-    print(f"[{utils.get_timestamp()}] HC-SR04 sensor initialized (Trigger: {config.HCSR04_TRIGGER_PIN}, Echo: {config.HCSR04_ECHO_PIN}).")
-except Exception as e:
-    print(f"[{utils.get_timestamp()}] Error initializing HC-SR04 sensor: {e}")
-    hcsr04_sensor_pins = None
-
-try:
-    turbidity_adc = machine.ADC(machine.Pin(config.TURBIDITY_ADC_PIN))
-    print(f"[{utils.get_timestamp()}] Turbidity ADC sensor initialized on pin {config.TURBIDITY_ADC_PIN}.")
-except Exception as e:
-    print(f"[{utils.get_timestamp()}] Error initializing ADC for Turbidity: {e}")
-    turbidity_adc = None
-
-try:
-    tds_adc = machine.ADC(machine.Pin(config.TDS_ADC_PIN))
-    print(f"[{utils.get_timestamp()}] TDS ADC sensor initialized on pin {config.TDS_ADC_PIN}.")
-except Exception as e:
-    print(f"[{utils.get_timestamp()}] Error initializing ADC for TDS: {e}")
-    tds_adc = None
-
-def _calculate_central_value(readings: list):
+    except Exception as e:
+        print(f"[{utils.get_timestamp()}] Error initializing DS18B20 sensor: {e}")
+        ds_sensor = None
+    return ds_sensor is not None
+
+def _init_hcsr04():
+    """Configures the HC-SR04 trigger and echo pins."""
+    global hcsr04_sensor_pins
+    try:
+        trigger_pin = machine.Pin(config.HCSR04_TRIGGER_PIN, machine.Pin.OUT)
+        echo_pin = machine.Pin(config.HCSR04_ECHO_PIN, machine.Pin.IN)
+        hcsr04_sensor_pins = {"trigger": trigger_pin, "echo": echo_pin}
+        print(f"[{utils.get_timestamp()}] HC-SR04 sensor initialized (Trigger: {config.HCSR04_TRIGGER_PIN}, Echo: {config.HCSR04_ECHO_PIN}).")
+    except Exception as e:
+        print(f"[{utils.get_timestamp()}] Error initializing HC-SR04 sensor: {e}")
+        hcsr04_sensor_pins = None
+    return hcsr04_sensor_pins is not None
+
+def _init_turbidity():
+    """Configures the ADC of the turbidity sensor."""
+    global turbidity_adc
+    try:
+        turbidity_adc = machine.ADC(machine.Pin(config.TURBIDITY_ADC_PIN))
+        print(f"[{utils.get_timestamp()}] Turbidity ADC sensor initialized on pin {config.TURBIDITY_ADC_PIN}.")
+    except Exception as e:
+        print(f"[{utils.get_timestamp()}] Error initializing ADC for Turbidity: {e}")
+        turbidity_adc = None
+    return turbidity_adc is not None
+
+def _init_tds():
+    """Configures the ADC of the TDS sensor."""
+    global tds_adc
+    try:
+        tds_adc = machine.ADC(machine.Pin(config.TDS_ADC_PIN))
+        print(f"[{utils.get_timestamp()}] TDS ADC sensor initialized on pin {config.TDS_ADC_PIN}.")
+    except Exception as e:
+        print(f"[{utils.get_timestamp()}] Error initializing ADC for TDS: {e}")
+        tds_adc = None
+    return tds_adc is not None
+
+def _calculate_central_value_and_spread(readings, count=None):
     """
     Calculates the value with the minimum sum of absolute distances to all other values.
     This value is one of the actual readings and is more robust to outliers than the mean.
+    Also returns the spread of the readings: the mean absolute distance between the
+    central value and the other readings.
+    Only the first count readings are used (all by default), so a preallocated buffer
+    can be passed. Returns a tuple (central_value, spread).
     """
-    if not readings:
-        return None
+    if count is None:
+        count = len(readings)
+    if count == 0:
+        return None, None
     min_sum_dist = float('inf')
     central_value = None
-    for i in range(len(readings)):
+    for i in range(count):
         current_sum_dist = 0
-        for j in range(len(readings)):
+        for j in range(count):
             if i == j:
                 continue
             current_sum_dist += abs(readings[i] - readings[j])
         if current_sum_dist < min_sum_dist:
             min_sum_dist = current_sum_dist
             central_value = readings[i]
-    return central_value
+    spread = min_sum_dist / (count - 1) if count > 1 else 0
+    return central_value, spread
 
-def read_temperature_ds18b20():
-    """Reads the temperature from the DS18B20 sensor."""
+def _start_ds18b20_conversion():
+    """Starts a DS18B20 temperature conversion. Returns True if it was started."""
     if not ds_sensor or not roms:
-        return None
+        return False
     try:
         ds_sensor.convert_temp()
-        time.sleep_ms(750)
+        return True
+    except Exception as e:
+        print(f"[{utils.get_timestamp()}] Error starting DS18B20 conversion: {e}")
+        return False
+
+def _read_ds18b20_result():
+    """Reads the result of the last DS18B20 conversion."""
+    if not ds_sensor or not roms:
+        return None
+    try:
         return ds_sensor.read_temp(roms[0])
     except Exception as e:
         print(f"[{utils.get_timestamp()}] Error reading DS18B20 temperature: {e}")
@@ -127,145 +253,301 @@ def read_tds_adc():
         print(f"[{utils.get_timestamp()}] Error reading TDS ADC: {e}")
         return None
 
-def _process_sensor_readings(reading_func, sensor_name, num_readings, reading_interval_s):
+def _burst_adc(adc, buffer, num_readings):
+    """Reads num_readings raw values back to back from an ADC into buffer. Returns the count."""
+    if not adc:
+        return 0
+    try:
+        for i in range(num_readings):
+            buffer[i] = adc.read_u16()
+        return num_readings
+    except Exception as e:
+        print(f"[{utils.get_timestamp()}] Error reading ADC burst: {e}")
+        return 0
+
+register_driver("temperature", "Temperature", _init_ds18b20, _read_ds18b20_result, "C",
+                "TEMP_NUM_READINGS", "TEMP_READING_INTERVAL_S",
+                change_threshold=config.TEMP_CHANGE_THRESHOLD, spread_threshold=config.TEMP_SPREAD_THRESHOLD,
+                start=_start_ds18b20_conversion, conversion_ms=750)
+register_driver("distance", "Distance", _init_hcsr04, read_distance_hcsr04, "cm",
+                "DIST_NUM_READINGS", "DIST_READING_INTERVAL_S",
+                change_threshold=config.DIST_CHANGE_THRESHOLD, spread_threshold=config.DIST_SPREAD_THRESHOLD)
+register_driver("turbidity", "Turbidity", _init_turbidity, read_turbidity_adc, "ADC",
+                "TURB_NUM_READINGS", "TURB_READING_INTERVAL_S",
+                change_threshold=config.TURB_CHANGE_THRESHOLD, spread_threshold=config.TURB_SPREAD_THRESHOLD,
+                burst=lambda buffer, n: _burst_adc(turbidity_adc, buffer, n), typecode='H')
+register_driver("tds", "TDS", _init_tds, read_tds_adc, "ADC",
+                "TDS_NUM_READINGS", "TDS_READING_INTERVAL_S",
+                change_threshold=config.TDS_CHANGE_THRESHOLD, spread_threshold=config.TDS_SPREAD_THRESHOLD,
+                burst=lambda buffer, n: _burst_adc(tds_adc, buffer, n), typecode='H')
+
+def _get_min_valid_readings(num_readings):
+    """Returns the number of successful readings needed for a good result."""
+    return max(1, (num_readings * config.SENSOR_MIN_VALID_PERCENT + 99) // 100)
+
+def _estimate_acquisition_ms(driver, num_readings, reading_interval_s):
+    """Estimates how long _collect_readings() takes for the given policy, in milliseconds."""
+    if num_readings <= 0 or (driver["burst"] and reading_interval_s == 0):
+        return 0
+    interval_ms = int(reading_interval_s * 1000)
+    if driver["start"]:
+        conversion_ms = driver["conversion_ms"]
+        return conversion_ms + (num_readings - 1) * max(interval_ms, conversion_ms)
+    return (num_readings - 1) * interval_ms
+
+def _collect_readings(driver, num_readings, reading_interval_s, min_valid_readings, deadline_ms=None,
+                      should_yield=None):
     """
-    Collects multiple readings, processes them using the central value method, and returns the result.
+    Collects raw readings from a driver into its preallocated buffer and returns their count.
+    Uses the driver's burst read when the interval is zero. For split-phase drivers the
+    conversion is started before waiting, so the conversion time overlaps the interval.
+    No sleep is done after the last reading.
+    Stops early when the deadline (a time.ticks_ms() value) would be exceeded, or when so many
+    readings failed that min_valid_readings can no longer be reached. If the deadline cuts the
+    acquisition short before min_valid_readings were collected, None is returned.
+    should_yield is an optional function checked before every reading; when it returns True
+    the acquisition is interrupted and None is returned.
     """
-    if not callable(reading_func):
-        print(f"[{utils.get_timestamp()}] {sensor_name}: Reading function is not callable.")
-        return None
-
-    collected_readings = []
-    print(f"[{utils.get_timestamp()}] {sensor_name}: Starting {num_readings} readings with {reading_interval_s}s interval...")
+    name = driver["name"]
+    buffer = driver["buffer"]
+    if driver["burst"] and reading_interval_s == 0:
+        return driver["burst"](buffer, num_readings)
 
+    count = 0
+    failures = 0
+    start = driver["start"]
+    conversion_ms = driver["conversion_ms"]
+    interval_ms = int(reading_interval_s * 1000)
+    log_readings = config.SENSOR_LOG_EACH_READING
     for i in range(num_readings):
-        value = reading_func()
+        if should_yield and should_yield():
+            print(f"[{utils.get_timestamp()}] {name}: Interrupted after {i}/{num_readings} readings.")
+            return None
+        if i == 0:
+            wait_ms = conversion_ms if start else 0
+        else:
+            wait_ms = max(interval_ms, conversion_ms) if start else interval_ms
+        if deadline_ms is not None and time.ticks_diff(deadline_ms, time.ticks_ms()) < wait_ms:
+            print(f"[{utils.get_timestamp()}] {name}: Deadline reached after {i}/{num_readings} readings.")
+            if count < min_valid_readings:
+                return None
+            break
+
+        value = None
+        if not start or start():
+            if wait_ms:
+                time.sleep_ms(wait_ms)
+            value = driver["read"]()
         if value is not None:
-            collected_readings.append(value)
-            formatted_value = f"{value:.2f}" if isinstance(value, float) else str(value)
-            print(f"[{utils.get_timestamp()}] {sensor_name} Reading {i+1}/{num_readings}: {formatted_value}")
+            buffer[count] = value
+            count += 1
+            if log_readings:
+                formatted_value = f"{value:.2f}" if isinstance(value, float) else str(value)
+                print(f"[{utils.get_timestamp()}] {name} Reading {i+1}/{num_readings}: {formatted_value}")
         else:
-            print(f"[{utils.get_timestamp()}] {sensor_name} Reading {i+1}/{num_readings}: Failure")
-        time.sleep(reading_interval_s)
+            failures += 1
+            if log_readings:
+                print(f"[{utils.get_timestamp()}] {name} Reading {i+1}/{num_readings}: Failure")
+            if failures > num_readings - min_valid_readings:
+                print(f"[{utils.get_timestamp()}] {name}: {failures} failures, {min_valid_readings} valid readings can no longer be reached. Aborting.")
+                break
+    return count
+
+def _signal_reading():
+    """Signals on the LED that a sensor reading is in progress."""
+    try:
+        import led_signals
+        if hasattr(led_signals, 'signal_sensor_reading_in_progress'):
+            led_signals.signal_sensor_reading_in_progress()
+    except ImportError:
+        pass
+
+def _process_sensor_readings(driver, deadline_ms=None, should_yield=None):
+    """
+    Collects multiple readings from a driver, processes them using the central value method,
+    and returns the result. The number of readings follows the adaptive sampler, and the result
+    is cached, added to the sensor's rollups and sampler statistics, and checked against the
+    alert rules. With a deadline (a time.ticks_ms() value), a sensor that has a previous value is not read
+    at all if the acquisition is not expected to finish in time; otherwise the number of
+    readings is reduced to fit. The LED reading signal is given after this budget check, so
+    skipped acquisitions do not wait for it. An acquisition interrupted by should_yield or cut short by the
+    deadline (see _collect_readings) is not counted as a sample; the sensor is marked for a
+    refresh instead.
+    Returns None if no good result could be obtained.
+    """
+    key = driver["key"]
+    name = driver["name"]
+    num_readings = adaptive_sampler.get_num_readings(key, getattr(config, driver["num_readings_setting"]))
+    num_readings = min(num_readings, len(driver["buffer"]))
+    reading_interval_s = getattr(config, driver["reading_interval_setting"])
+
+    if deadline_ms is not None:
+        budget_ms = time.ticks_diff(deadline_ms, time.ticks_ms())
+        if _estimate_acquisition_ms(driver, num_readings, reading_interval_s) > budget_ms:
+            if driver["last_value"] is not None:
+                print(f"[{utils.get_timestamp()}] {name}: Acquisition does not fit in {budget_ms}ms. Skipping.")
+                return None
+            while num_readings > 1 and _estimate_acquisition_ms(driver, num_readings, reading_interval_s) > budget_ms:
+                num_readings -= 1
 
-    if not collected_readings:
-        print(f"[{utils.get_timestamp()}] {sensor_name}: No successful readings.")
+    _signal_reading()
+    min_valid_readings = _get_min_valid_readings(num_readings)
+    print(f"[{utils.get_timestamp()}] {name}: Starting {num_readings} readings with {reading_interval_s}s interval...")
+    count = _collect_readings(driver, num_readings, reading_interval_s, min_valid_readings, deadline_ms,
+                              should_yield)
+    if count is None:
+        driver["refresh_pending"] = True
         return None
 
-    final_sensor_value = _calculate_central_value(collected_readings)
+    if count < min_valid_readings:
+        print(f"[{utils.get_timestamp()}] {name}: Not enough successful readings ({count}/{min_valid_readings}).")
+        adaptive_sampler.observe(key, None)
+        return None
+
+    final_sensor_value, spread = _calculate_central_value_and_spread(driver["buffer"], count)
 
     if final_sensor_value is None:
-        print(f"[{utils.get_timestamp()}] {sensor_name}: Could not determine a central value from readings: {collected_readings}")
+        print(f"[{utils.get_timestamp()}] {name}: Could not determine a central value from {count} readings.")
+        adaptive_sampler.observe(key, None)
         return None
 
+    if driver["convert"]:
+        final_sensor_value = driver["convert"](final_sensor_value)
+
+    if config.SENSOR_LOG_EACH_READING:
+        print(f"[{utils.get_timestamp()}] {name}: Original readings: {list(driver['buffer'][:count])}")
     formatted_final_value = f"{final_sensor_value:.2f}" if isinstance(final_sensor_value, float) else final_sensor_value
-    print(f"[{utils.get_timestamp()}] {sensor_name}: Original readings: {collected_readings}")
-    print(f"[{utils.get_timestamp()}] {sensor_name}: Final value (Minimum Sum of Distances): {formatted_final_value}")
+    print(f"[{utils.get_timestamp()}] {name}: Final value (Minimum Sum of Distances): {formatted_final_value}")
+
+    driver["last_value"] = final_sensor_value
+    driver["last_ticks_ms"] = time.ticks_ms()
+    driver["sequence"] += 1
+    rollups.record(key, final_sensor_value)
+    # Alerts use the EWMA/variance before this value is folded in
+    alerts.evaluate(key, final_sensor_value)
+    adaptive_sampler.observe(key, final_sensor_value, spread)
 
     return final_sensor_value
 
+def _get_cached_value(driver, max_age_s):
+    """Returns the last value of a driver if it is not older than max_age_s, otherwise None."""
+    if not max_age_s or driver["last_ticks_ms"] is None:
+        return None
+    if time.ticks_diff(time.ticks_ms(), driver["last_ticks_ms"]) > max_age_s * 1000:
+        return None
+    return driver["last_value"]
+
+def _get_remaining_cache_s(driver):
+    """
+    Returns for how many more seconds the last value of a driver is served from the cache.
+    With adaptive sampling the value is kept until the next scheduled sample replaces it
+    (bounded by the sampling period, so a value is not kept across failed samples); without
+    it the value expires config.SENSOR_CACHE_MAX_AGE_S seconds after its acquisition.
+    """
+    if driver["last_ticks_ms"] is None:
+        return 0
+    key = driver["key"]
+    age_s = time.ticks_diff(time.ticks_ms(), driver["last_ticks_ms"]) // 1000
+    until_due_s = adaptive_sampler.get_seconds_until_due(key)
+    if until_due_s is None:
+        return max(0, config.SENSOR_CACHE_MAX_AGE_S - age_s)
+    return max(0, min(until_due_s, adaptive_sampler.get_period_s(key) - age_s))
+
+def get_cache_validator(sensor_name: str):
+    """
+    Returns (etag, max_age_s) for the value a read_specific_sensor() call would return now
+    from the cache, or None if a new acquisition would be needed.
+    The ETag is derived from the sample sequence number; max_age_s is the time until the
+    value is replaced (see _get_remaining_cache_s).
+    """
+    driver = _drivers.get(sensor_name)
+    if driver is None:
+        return None
+    max_age_s = _get_remaining_cache_s(driver)
+    if max_age_s <= 0:
+        return None
+    return f'"{sensor_name}-{_etag_prefix}-{driver["sequence"]}"', max_age_s
+
 def read_all_sensors():
     """Reads all configured sensors, applying the central value calculation."""
-    try:
-        import led_signals
-        if hasattr(led_signals, 'signal_sensor_reading_in_progress'):
-            led_signals.signal_sensor_reading_in_progress()
-    except ImportError:
-        pass
-
     print(f"[{utils.get_timestamp()}] Starting reading of all sensors...")
     data = {}
 
-    if ds_sensor:
-        data["temperature"] = _process_sensor_readings(
-            reading_func=read_temperature_ds18b20,
-            sensor_name="Temperature",
-            num_readings=config.TEMP_NUM_READINGS,
-            reading_interval_s=config.TEMP_READING_INTERVAL_S)
-    else:
-        data["temperature"] = None
-
-    if hcsr04_sensor_pins:
-        data["distance"] = _process_sensor_readings(
-            reading_func=read_distance_hcsr04,
-            sensor_name="Distance",
-            num_readings=config.DIST_NUM_READINGS,
-            reading_interval_s=config.DIST_READING_INTERVAL_S)
-    else:
-        data["distance"] = None
-
-    if turbidity_adc:
-        data["turbidity"] = _process_sensor_readings(
-            reading_func=read_turbidity_adc,
-            sensor_name="Turbidity",
-            num_readings=config.TURB_NUM_READINGS,
-            reading_interval_s=config.TURB_READING_INTERVAL_S)
-    else:
-        data["turbidity"] = None
-
-    if tds_adc:
-        data["tds"] = _process_sensor_readings(
-            reading_func=read_tds_adc,
-            sensor_name="TDS",
-            num_readings=config.TDS_NUM_READINGS,
-            reading_interval_s=config.TDS_READING_INTERVAL_S)
-    else:
-        data["tds"] = None
+    for key in _driver_order:
+        driver = _drivers[key]
+        data[key] = _process_sensor_readings(driver) if _ensure_initialized(driver) else None
 
     print(f"[{utils.get_timestamp()}] Final sensor data: {data}")
     return data
 
-def read_specific_sensor(sensor_name_to_read: str):
-    """Reads a specific sensor based on the provided name."""
-    try:
-        import led_signals
-        if hasattr(led_signals, 'signal_sensor_reading_in_progress'):
-            led_signals.signal_sensor_reading_in_progress()
-    except ImportError:
-        pass
-
-    print(f"[{utils.get_timestamp()}] Starting reading for sensor: {sensor_name_to_read}")
-    sensor_value = None
-    unit = None
-
-    if sensor_name_to_read == "temperature":
-        if ds_sensor:
-            sensor_value = _process_sensor_readings(
-                reading_func=read_temperature_ds18b20,
-                sensor_name="Temperature",
-                num_readings=config.TEMP_NUM_READINGS,
-                reading_interval_s=config.TEMP_READING_INTERVAL_S)
-            unit = "C"
-    elif sensor_name_to_read == "distance":
-        if hcsr04_sensor_pins:
-            sensor_value = _process_sensor_readings(
-                reading_func=read_distance_hcsr04,
-                sensor_name="Distance",
-                num_readings=config.DIST_NUM_READINGS,
-                reading_interval_s=config.DIST_READING_INTERVAL_S)
-            unit = "cm"
-    elif sensor_name_to_read == "turbidity":
-        if turbidity_adc:
-            sensor_value = _process_sensor_readings(
-                reading_func=read_turbidity_adc,
-                sensor_name="Turbidity",
-                num_readings=config.TURB_NUM_READINGS,
-                reading_interval_s=config.TURB_READING_INTERVAL_S)
-            unit = "ADC"
-    elif sensor_name_to_read == "tds":
-        if tds_adc:
-            sensor_value = _process_sensor_readings(
-                reading_func=read_tds_adc,
-                sensor_name="TDS",
-                num_readings=config.TDS_NUM_READINGS,
-                reading_interval_s=config.TDS_READING_INTERVAL_S)
-            unit = "ADC"
-    else:
+def read_specific_sensor(sensor_name_to_read: str, max_age_s=None, deadline_ms=None):
+    """
+    Reads a specific sensor based on the provided name.
+    A value acquired less than max_age_s seconds ago is returned without a new acquisition.
+    By default the cached value is used until it is replaced by the next scheduled sample,
+    or for config.SENSOR_CACHE_MAX_AGE_S seconds without adaptive sampling.
+    With a deadline (a time.ticks_ms() value), if no fresh value can be acquired in time the last
+    good value is returned with "stale": True and its "age_s", and a background refresh is scheduled.
+    """
+    driver = _drivers.get(sensor_name_to_read)
+    if driver is None:
         print(f"[{utils.get_timestamp()}] Unknown sensor '{sensor_name_to_read}'.")
         return None
 
+    if max_age_s is None:
+        sensor_value = driver["last_value"] if _get_remaining_cache_s(driver) > 0 else None
+    else:
+        sensor_value = _get_cached_value(driver, max_age_s)
+    if sensor_value is not None:
+        print(f"[{utils.get_timestamp()}] Using cached value for sensor: {sensor_name_to_read}")
+    elif _ensure_initialized(driver):
+        print(f"[{utils.get_timestamp()}] Starting reading for sensor: {sensor_name_to_read}")
+        sensor_value = _process_sensor_readings(driver, deadline_ms)
+
+        if sensor_value is None and deadline_ms is not None and driver["last_value"] is not None:
+            driver["refresh_pending"] = True
+            age_s = time.ticks_diff(time.ticks_ms(), driver["last_ticks_ms"]) // 1000
+            print(f"[{utils.get_timestamp()}] Serving stale value for sensor {sensor_name_to_read} ({age_s}s old).")
+            return {"sensor": sensor_name_to_read, "value": driver["last_value"], "unit": driver["unit"],
+                    "stale": True, "age_s": age_s}
+
     if sensor_value is not None:
-        return {"sensor": sensor_name_to_read, "value": sensor_value, "unit": unit}
+        return {"sensor": sensor_name_to_read, "value": sensor_value, "unit": driver["unit"]}
     else:
         print(f"[{utils.get_timestamp()}] Failed to read sensor {sensor_name_to_read}.")
         return None
+
+def run_scheduled_sampling(should_yield=None):
+    """
+    Samples the next sensor, in round-robin order, that the adaptive sampler reports as due
+    or that served a stale value and needs a refresh. Called by the HTTP server between
+    requests; at most one sensor is sampled per call so a waiting client is never blocked by
+    a sweep over all sensors. should_yield is an optional function returning True when a
+    client is waiting: it is checked between readings and interrupts the acquisition, which
+    is then retried on a later call. Sensors whose cached value is still fresh are skipped.
+    """
+    global _next_scheduled_index
+    if should_yield and should_yield():
+        return
+    num_drivers = len(_driver_order)
+    for offset in range(num_drivers):
+        index = (_next_scheduled_index + offset) % num_drivers
+        key = _driver_order[index]
+        driver = _drivers[key]
+        if not driver["refresh_pending"] and not adaptive_sampler.is_due(key):
+            continue
+        if not _ensure_initialized(driver):
+            continue
+        if _get_cached_value(driver, config.SENSOR_CACHE_MAX_AGE_S) is not None:
+            driver["refresh_pending"] = False
+            continue
+
+        _next_scheduled_index = (index + 1) % num_drivers
+        driver["refresh_pending"] = False
+        print(f"[{utils.get_timestamp()}] Scheduled sampling of sensor: {key}")
+        try:
+            _process_sensor_readings(driver, should_yield=should_yield)
+        except Exception as e:
+            print(f"[{utils.get_timestamp()}] Error in scheduled sampling of {key}: {e}")
+            adaptive_sampler.observe(key, None)
+        return
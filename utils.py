@@ -1,11 +1,93 @@
 import time
+import gc
 import machine
+import config
+
+# Boot timeline: (phase name, time.ticks_ms()) pairs recorded since the last reset.
+boot_phases = []
 
 def get_timestamp():
     """Returns the current date and time formatted as a string."""
     t = time.localtime()
     return f"{t[0]}-{t[1]:02d}-{t[2]:02d} {t[3]:02d}:{t[4]:02d}:{t[5]:02d}"
 
+def mark_boot_phase(name):
+    """Records the time since reset at which a boot phase was reached (first time only)."""
+    for phase in boot_phases:
+        if phase[0] == name:
+            return
+    boot_phases.append((name, time.ticks_ms()))
+
+def get_boot_timeline():
+    """Returns the boot timeline as a list of [phase name, ms since reset]."""
+    return [[name, ticks] for name, ticks in boot_phases]
+
+# Pause statistics of the garbage collections run through collect_garbage()
+gc_stats = {"collections": 0, "last_pause_us": 0, "max_pause_us": 0, "total_pause_us": 0}
+
+def configure_gc():
+    """Applies the configured automatic garbage collection threshold."""
+    if config.GC_THRESHOLD_BYTES > 0:
+        gc.threshold(config.GC_THRESHOLD_BYTES)
+    else:
+        gc.threshold(-1)
+
+def collect_garbage():
+    """Runs a garbage collection and records its pause time."""
+    start = time.ticks_us()
+    gc.collect()
+    pause_us = time.ticks_diff(time.ticks_us(), start)
+    gc_stats["collections"] += 1
+    gc_stats["last_pause_us"] = pause_us
+    gc_stats["total_pause_us"] += pause_us
+    if pause_us > gc_stats["max_pause_us"]:
+        gc_stats["max_pause_us"] = pause_us
+
+def _find_largest_free_block():
+    """
+    Finds the largest block that can currently be allocated, by bisecting on allocation
+    attempts. Slow (it collects after every attempt); only meant for diagnostics.
+    """
+    gc.collect()
+    low, high = 0, gc.mem_free()
+    while low < high:
+        size = (low + high + 1) // 2
+        try:
+            block = bytearray(size)
+            del block
+            low = size
+        except MemoryError:
+            high = size - 1
+        gc.collect()
+    return low
+
+def get_memory_stats():
+    """Returns heap usage, the largest free block and the GC pause statistics."""
+    largest_free_block = _find_largest_free_block()
+    stats = {"threshold": gc.threshold()}
+    stats.update(gc_stats)
+    return {
+        "free": gc.mem_free(),
+        "allocated": gc.mem_alloc(),
+        "largest_free_block": largest_free_block,
+        "gc": stats,
+    }
+
+def get_reset_cause():
+    """Returns the cause of the last reset as a string."""
+    causes = {
+        getattr(machine, "PWRON_RESET", None): "power_on",
+        getattr(machine, "HARD_RESET", None): "hard",
+        getattr(machine, "WDT_RESET", None): "watchdog",
+        getattr(machine, "DEEPSLEEP_RESET", None): "deepsleep",
+        getattr(machine, "SOFT_RESET", None): "soft",
+    }
+    try:
+        cause = machine.reset_cause()
+    except Exception:
+        return "unknown"
+    return causes.get(cause, str(cause))
+
 def hard_reset():
     """
     Triggers a hard reset of the device.
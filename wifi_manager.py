@@ -4,10 +4,14 @@ import config
 import utils
 
 wlan = None
+time_sync_pending = True
 
-def connect_wifi(ssid=None, password=None, attempts=3, connection_timeout=15):
+def connect_wifi(ssid=None, password=None, attempts=3, connection_timeout=15, sync_time=True, on_wait=None):
     """
     Tries to connect to the specified Wi-Fi network.
+    If sync_time is False, NTP synchronization is left to a later sync_ntp_time() call.
+    on_wait, if given, is called once while waiting for the first connection attempt,
+    so other initialization can overlap the Wi-Fi join.
     Returns True on success, False on failure.
     """
     global wlan
@@ -34,23 +38,28 @@ def connect_wifi(ssid=None, password=None, attempts=3, connection_timeout=15):
         try:
             wlan.connect(_ssid, _password)
 
+            if on_wait:
+                on_wait()
+                on_wait = None
+
             start_time = time.time()
+            last_status = None
             while not wlan.isconnected():
                 if time.time() - start_time > connection_timeout:
                     print(f"[{utils.get_timestamp()}] Timeout ({connection_timeout}s) on attempt {attempt + 1}.")
                     break
-                print(f"[{utils.get_timestamp()}] Waiting for connection... Status: {wlan.status()}")
-                time.sleep(2)
+                status = wlan.status()
+                if status != last_status:
+                    print(f"[{utils.get_timestamp()}] Waiting for connection... Status: {status}")
+                    last_status = status
+                time.sleep_ms(250)
 
             if wlan.isconnected():
                 print(f"[{utils.get_timestamp()}] Wi-Fi connected successfully!")
                 print(f"[{utils.get_timestamp()}] IP settings: {wlan.ifconfig()}")
-                try:
-                    import ntptime
-                    ntptime.settime()
-                    print(f"[{utils.get_timestamp()}] Time synchronized via NTP: {utils.get_timestamp()}")
-                except Exception as e:
-                    print(f"[{utils.get_timestamp()}] Failed to synchronize NTP time: {e}")
+                utils.mark_boot_phase("wifi_connected")
+                if sync_time:
+                    sync_ntp_time()
                 return True
             else:
                 wlan.disconnect()
@@ -66,6 +75,23 @@ def connect_wifi(ssid=None, password=None, attempts=3, connection_timeout=15):
     print(f"[{utils.get_timestamp()}] Failed to connect to Wi-Fi '{_ssid}' after {attempts} attempts.")
     return False
 
+def sync_ntp_time():
+    """
+    Synchronizes the RTC via NTP.
+    Returns True on success, False on failure (the sync stays pending).
+    """
+    global time_sync_pending
+    try:
+        import ntptime
+        ntptime.settime()
+        time_sync_pending = False
+        utils.mark_boot_phase("time_synced")
+        print(f"[{utils.get_timestamp()}] Time synchronized via NTP: {utils.get_timestamp()}")
+        return True
+    except Exception as e:
+        print(f"[{utils.get_timestamp()}] Failed to synchronize NTP time: {e}")
+        return False
+
 def disconnect_wifi():
     """Disconnects from Wi-Fi and deactivates the interface."""
     global wlan